@@ -118,6 +118,9 @@ with open("data/abi/zkstars/abi.json", "r") as file:
 with open("data/abi/rocketsam/abi.json", "r") as file:
     ROCKETSAM_ABI = json.load(file)
 
+with open("data/abi/multicall3/abi.json", "r") as file:
+    MULTICALL3_ABI = json.load(file)
+
 ZKSYNC_BRIDGE_CONTRACT = "0x32400084c286cf3e17e7b677ea9583e60a000324"
 
 ORBITER_CONTRACT = ""
@@ -126,6 +129,14 @@ CONTRACT_PATH = Path("data/deploy/Token.json")
 
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
+MULTICALL3_CONTRACTS = {
+    "ethereum": "0xcA11bde05977b3631167028862bE2a173976CA11",
+    "arbitrum": "0xcA11bde05977b3631167028862bE2a173976CA11",
+    "optimism": "0xcA11bde05977b3631167028862bE2a173976CA11",
+    "polygon_zkevm": "0xcA11bde05977b3631167028862bE2a173976CA11",
+    "zksync": "0xF9cda624FBC7e059355ce98a31693d299FACd963",
+}
+
 ZKSYNC_TOKENS = {
     "ETH": "0x5aea5775959fbc2557cc8789bc1bf90a239d9a91",
     "WETH": "0x5aea5775959fbc2557cc8789bc1bf90a239d9a91",
@@ -1,7 +1,7 @@
 import random
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 import questionary
 from loguru import logger
@@ -129,6 +129,18 @@ def _async_run_module(module, account_id, key, recipient):
     asyncio.run(run_module(module, account_id, key, recipient))
 
 
+def _run_wallet_group(module, wallets):
+    for account in wallets:
+        _async_run_module(module, account.get("id"), account.get("key"), account.get("proxy"))
+
+
+def group_wallets(wallets):
+    groups = {}
+    for account in wallets:
+        groups.setdefault(account.get("key"), []).append(account)
+    return list(groups.values())
+
+
 def main(module):
     wallets = get_wallets()
 
@@ -136,16 +148,16 @@ def main(module):
         random.shuffle(wallets)
 
     with ThreadPoolExecutor(max_workers=QUANTITY_THREADS) as executor:
-        for _, account in enumerate(wallets, start=1):
-            executor.submit(
-                _async_run_module,
-                module,
-                account.get("id"),
-                account.get("key"),
-                account.get("proxy")
-            )
+        futures = []
+        for group in group_wallets(wallets):
+            futures.append(executor.submit(_run_wallet_group, module, group))
             time.sleep(random.randint(THREAD_SLEEP_FROM, THREAD_SLEEP_TO))
 
+        for future in as_completed(futures):
+            error = future.exception()
+            if error is not None:
+                logger.error(error)
+
 
 if __name__ == '__main__':
     print("❤️ Subscribe to me – https://t.me/sybilwave\n")
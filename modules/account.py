@@ -1,20 +1,27 @@
 import asyncio
 import time
 import random
-from typing import Union, Dict
+from typing import Union, Dict, List, Tuple
 
+from hexbytes import HexBytes
 from loguru import logger
 from web3 import AsyncWeb3
 from eth_account import Account as EthereumAccount
 from web3.exceptions import TransactionNotFound
 from web3.middleware import async_geth_poa_middleware
+from web3.types import RPCEndpoint
 
-from config import RPC, ERC20_ABI, ZKSYNC_TOKENS
+from config import RPC, ERC20_ABI, ZKSYNC_TOKENS, MULTICALL3_ABI, MULTICALL3_CONTRACTS
 from settings import GAS_MULTIPLIER
+from utils.helpers import to_checksum_address
+from utils.provider import get_provider
 from utils.sleeping import sleep
 
 
 class Account:
+    _CHAIN_ID_CACHE: Dict[str, int] = {}
+    _GAS_PRICE_CACHE: Dict[str, Tuple[float, int]] = {}
+
     def __init__(self, account_id: int, private_key: str, chain: str, proxy: Union[None, str]) -> None:
         self.account_id = account_id
         self.private_key = private_key
@@ -22,46 +29,89 @@ class Account:
         self.explorer = RPC[chain]["explorer"]
         self.token = RPC[chain]["token"]
 
-        request_kwargs = {}
-        
-        if proxy:
-            request_kwargs = {"proxy": f"http://{proxy}"}
-
         self.w3 = AsyncWeb3(
-            AsyncWeb3.AsyncHTTPProvider(random.choice(RPC[chain]["rpc"])),
+            get_provider(random.choice(RPC[chain]["rpc"]), proxy),
             middlewares=[async_geth_poa_middleware],
-            request_kwargs=request_kwargs
         )
         self.account = EthereumAccount.from_key(private_key)
         self.address = self.account.address
 
+        self.contracts = {}
+
+    async def get_chain_id(self) -> int:
+        if self.chain not in self._CHAIN_ID_CACHE:
+            self._CHAIN_ID_CACHE[self.chain] = await self.w3.eth.chain_id
+
+        return self._CHAIN_ID_CACHE[self.chain]
+
+    async def get_gas_price(self) -> int:
+        cached = self._GAS_PRICE_CACHE.get(self.chain)
+
+        if cached is not None and time.monotonic() - cached[0] < 0.5:
+            return cached[1]
+
+        gas_price = await self.w3.eth.gas_price
+        self._GAS_PRICE_CACHE[self.chain] = (time.monotonic(), gas_price)
+
+        return gas_price
+
     async def get_tx_data(self, value: int = 0):
+        chain_id, gas_price, nonce = await asyncio.gather(
+            self.get_chain_id(),
+            self.get_gas_price(),
+            self.w3.eth.get_transaction_count(self.address),
+        )
+
         tx = {
-            "chainId": await self.w3.eth.chain_id,
+            "chainId": chain_id,
             "from": self.address,
             "value": value,
-            "gasPrice": await self.w3.eth.gas_price,
-            "nonce": await self.w3.eth.get_transaction_count(self.address),
+            "gasPrice": gas_price,
+            "nonce": nonce,
         }
         return tx
 
+    async def build_contract_tx(self, contract, fn_name: str, args=None, value: int = 0) -> Dict:
+        tx_data = await self.get_tx_data(value)
+        tx_data.update({"to": contract.address, "data": contract.encodeABI(fn_name, args=args)})
+
+        return tx_data
+
     def get_contract(self, contract_address: str, abi=None):
-        contract_address = self.w3.to_checksum_address(contract_address)
+        contract_address = to_checksum_address(contract_address)
 
         if abi is None:
             abi = ERC20_ABI
 
-        contract = self.w3.eth.contract(address=contract_address, abi=abi)
+        key = (contract_address, id(abi))
+
+        if key not in self.contracts:
+            self.contracts[key] = self.w3.eth.contract(address=contract_address, abi=abi)
+
+        return self.contracts[key]
+
+    async def multicall(self, calls: List[Tuple[str, str]]) -> List[bytes]:
+        contract = self.get_contract(MULTICALL3_CONTRACTS[self.chain], MULTICALL3_ABI)
+
+        results = await contract.functions.aggregate3(
+            [(target, False, call_data) for target, call_data in calls]
+        ).call()
 
-        return contract
+        return [return_data for _, return_data in results]
 
     async def get_balance(self, contract_address: str) -> Dict:
-        contract_address = self.w3.to_checksum_address(contract_address)
+        contract_address = to_checksum_address(contract_address)
         contract = self.get_contract(contract_address)
 
-        symbol = await contract.functions.symbol().call()
-        decimal = await contract.functions.decimals().call()
-        balance_wei = await contract.functions.balanceOf(self.address).call()
+        symbol_data, decimal_data, balance_data = await self.multicall([
+            (contract_address, contract.encodeABI("symbol")),
+            (contract_address, contract.encodeABI("decimals")),
+            (contract_address, contract.encodeABI("balanceOf", args=(self.address,))),
+        ])
+
+        symbol = self.w3.codec.decode(["string"], symbol_data)[0]
+        decimal = self.w3.codec.decode(["uint8"], decimal_data)[0]
+        balance_wei = self.w3.codec.decode(["uint256"], balance_data)[0]
 
         balance = balance_wei / 10 ** decimal
 
@@ -95,19 +145,19 @@ class Account:
         return amount_wei, amount, balance
 
     async def check_allowance(self, token_address: str, contract_address: str) -> float:
-        token_address = self.w3.to_checksum_address(token_address)
-        contract_address = self.w3.to_checksum_address(contract_address)
+        token_address = to_checksum_address(token_address)
+        contract_address = to_checksum_address(contract_address)
 
-        contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
+        contract = self.get_contract(token_address)
         amount_approved = await contract.functions.allowance(self.address, contract_address).call()
 
         return amount_approved
 
     async def approve(self, amount: int, token_address: str, contract_address: str):
-        token_address = self.w3.to_checksum_address(token_address)
-        contract_address = self.w3.to_checksum_address(contract_address)
+        token_address = to_checksum_address(token_address)
+        contract_address = to_checksum_address(contract_address)
 
-        contract = self.w3.eth.contract(address=token_address, abi=ERC20_ABI)
+        contract = self.get_contract(token_address)
 
         allowance_amount = await self.check_allowance(token_address, contract_address)
 
@@ -116,12 +166,7 @@ class Account:
 
             approve_amount = 2 ** 128 if amount > allowance_amount else 0
 
-            tx_data = await self.get_tx_data()
-
-            transaction = await contract.functions.approve(
-                contract_address,
-                approve_amount
-            ).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(contract, "approve", (contract_address, approve_amount))
 
             signed_txn = await self.sign(transaction)
 
@@ -133,7 +178,10 @@ class Account:
 
     async def wait_until_tx_finished(self, hash: str, max_wait_time=180):
         start_time = time.time()
+        attempt = 0
         while True:
+            poll_delay = min(1.0, 0.15 * 1.5 ** attempt)
+            attempt += 1
             try:
                 receipts = await self.w3.eth.get_transaction_receipt(hash)
                 status = receipts.get("status")
@@ -141,7 +189,7 @@ class Account:
                     logger.success(f"[{self.account_id}][{self.address}] {self.explorer}{hash} successfully!")
                     return True
                 elif status is None:
-                    await asyncio.sleep(0.3)
+                    await asyncio.sleep(poll_delay)
                 else:
                     logger.error(f"[{self.account_id}][{self.address}] {self.explorer}{hash} transaction failed!")
                     return False
@@ -149,7 +197,7 @@ class Account:
                 if time.time() - start_time > max_wait_time:
                     print(f'FAILED TX: {hash}')
                     return False
-                await asyncio.sleep(1)
+                await asyncio.sleep(poll_delay)
 
     async def sign(self, transaction):
         gas = await self.w3.eth.estimate_gas(transaction)
@@ -157,11 +205,19 @@ class Account:
 
         transaction.update({"gas": gas})
 
-        signed_txn = self.w3.eth.account.sign_transaction(transaction, self.private_key)
+        signed_txn = self.account.sign_transaction(transaction)
 
         return signed_txn
 
     async def send_raw_transaction(self, signed_txn):
-        txn_hash = await self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
+        response = await self.w3.provider.make_request(
+            RPCEndpoint("eth_sendRawTransaction"),
+            [self.w3.to_hex(signed_txn.rawTransaction)]
+        )
+
+        if "error" in response:
+            raise ValueError(response["error"])
+
+        txn_hash = HexBytes(response["result"])
 
         return txn_hash
@@ -3,7 +3,7 @@ from typing import Union, Dict
 from loguru import logger
 from config import BASILISK_CONTRACTS, BASILISK_ABI
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from utils.sleeping import sleep
 from .account import Account
 
@@ -45,9 +45,7 @@ class Basilisk(Account):
 
         logger.info(f"[{self.account_id}][{self.address}] Make deposit on Basilisk | {amount} ETH")
 
-        tx_data = await self.get_tx_data(amount_wei)
-
-        transaction = await self.contract.functions.mint().build_transaction(tx_data)
+        transaction = await self.build_contract_tx(self.contract, "mint", value=amount_wei)
 
         signed_txn = await self.sign(transaction)
 
@@ -71,9 +69,7 @@ class Basilisk(Account):
                 f"{self.w3.from_wei(amount, 'ether')} ETH"
             )
 
-            tx_data = await self.get_tx_data()
-
-            transaction = await self.contract.functions.redeemUnderlying(amount).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(self.contract, "redeemUnderlying", (amount,))
 
             signed_txn = await self.sign(transaction)
 
@@ -90,11 +86,11 @@ class Basilisk(Account):
 
         contract = self.get_contract(BASILISK_CONTRACTS["collateral"], BASILISK_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.enterMarkets(
-            [self.w3.to_checksum_address(BASILISK_CONTRACTS["landing"])]
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "enterMarkets",
+            ([to_checksum_address(BASILISK_CONTRACTS["landing"])],)
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -109,11 +105,11 @@ class Basilisk(Account):
 
         contract = self.get_contract(BASILISK_CONTRACTS["collateral"], BASILISK_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.exitMarket(
-            self.w3.to_checksum_address(BASILISK_CONTRACTS["landing"])
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "exitMarket",
+            (to_checksum_address(BASILISK_CONTRACTS["landing"]),)
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -59,12 +59,15 @@ class Bungee(Account):
                 f"{to_chain.title()} | {self.w3.from_wei(amount, 'ether')} ETH"
             )
 
-            tx_data = await self.get_tx_data(amount)
-
-            transaction = await self.contract.functions.depositNativeToken(
-                self.chain_ids[to_chain],
-                self.address
-            ).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(
+                self.contract,
+                "depositNativeToken",
+                (
+                    self.chain_ids[to_chain],
+                    self.address
+                ),
+                amount
+            )
 
             signed_txn = await self.sign(transaction)
 
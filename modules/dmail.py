@@ -5,15 +5,17 @@ from typing import Union
 from loguru import logger
 from config import DMAIL_ABI, DMAIL_CONTRACT
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
+DMAIL_CHECKSUM_CONTRACT = to_checksum_address(DMAIL_CONTRACT)
+
 
 class Dmail(Account):
     def __init__(self, account_id: int, private_key: str, proxy: Union[None, str]) -> None:
         super().__init__(account_id=account_id, private_key=private_key, proxy=proxy, chain="zksync")
 
-        self.contract = self.get_contract(DMAIL_CONTRACT, DMAIL_ABI)
+        self.contract = self.get_contract(DMAIL_CHECKSUM_CONTRACT, DMAIL_ABI)
 
     @retry
     @check_gas
@@ -26,7 +28,7 @@ class Dmail(Account):
         data = self.contract.encodeABI("send_mail", args=(email, theme))
 
         tx_data = await self.get_tx_data()
-        tx_data.update({"data": data, "to": self.w3.to_checksum_address(DMAIL_CONTRACT)})
+        tx_data.update({"data": data, "to": DMAIL_CHECKSUM_CONTRACT})
 
         signed_txn = await self.sign(tx_data)
 
@@ -35,9 +35,12 @@ class EraDomain(Account):
 
         domain_name = await self.get_random_name()
         
-        tx_data = await self.get_tx_data(self.w3.to_wei(0.003, "ether"))
-
-        transaction = await self.contract.functions.Register(domain_name).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            self.contract,
+            "Register",
+            (domain_name,),
+            self.w3.to_wei(0.003, "ether")
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -3,7 +3,7 @@ from typing import Union
 from loguru import logger
 from config import ERALEND_CONTRACTS, ERALEND_ABI
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from utils.sleeping import sleep
 from .account import Account
 
@@ -43,10 +43,10 @@ class Eralend(Account):
         )
 
         tx = {
-            "chainId": await self.w3.eth.chain_id,
+            "chainId": await self.get_chain_id(),
             "from": self.address,
-            "to": self.w3.to_checksum_address(ERALEND_CONTRACTS["landing"]),
-            "gasPrice": await self.w3.eth.gas_price,
+            "to": to_checksum_address(ERALEND_CONTRACTS["landing"]),
+            "gasPrice": await self.get_gas_price(),
             "nonce": await self.w3.eth.get_transaction_count(self.address),
             "value": amount_wei,
             "data": "0x1249c58b"
@@ -76,9 +76,7 @@ class Eralend(Account):
                 f"{self.w3.from_wei(amount, 'ether')} ETH"
             )
 
-            tx_data = await self.get_tx_data()
-
-            transaction = await self.contract.functions.redeemUnderlying(amount).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(self.contract, "redeemUnderlying", (amount,))
 
             signed_txn = await self.sign(transaction)
 
@@ -95,11 +93,11 @@ class Eralend(Account):
 
         contract = self.get_contract(ERALEND_CONTRACTS["collateral"], ERALEND_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.enterMarkets(
-            [self.w3.to_checksum_address(ERALEND_CONTRACTS["landing"])]
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "enterMarkets",
+            ([to_checksum_address(ERALEND_CONTRACTS["landing"])],)
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -114,11 +112,11 @@ class Eralend(Account):
 
         contract = self.get_contract(ERALEND_CONTRACTS["collateral"], ERALEND_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.exitMarket(
-            self.w3.to_checksum_address(ERALEND_CONTRACTS["landing"])
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "exitMarket",
+            (to_checksum_address(ERALEND_CONTRACTS["landing"]),)
+        )
 
         signed_txn = await self.sign(transaction)
 
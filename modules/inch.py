@@ -5,7 +5,7 @@ from loguru import logger
 from config import INCH_CONTRACT, ZKSYNC_TOKENS
 from settings import INCH_API_KEY
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -21,11 +21,11 @@ class Inch(Account):
             self.proxy = f"http://{proxy}"
 
     async def build_tx(self, from_token: str, to_token: str, amount: int, slippage: int):
-        url = f"https://api.1inch.dev/swap/v5.2/{await self.w3.eth.chain_id}/swap"
+        url = f"https://api.1inch.dev/swap/v5.2/{await self.get_chain_id()}/swap"
 
         params = {
-            "src": self.w3.to_checksum_address(from_token),
-            "dst": self.w3.to_checksum_address(to_token),
+            "src": to_checksum_address(from_token),
+            "dst": to_checksum_address(to_token),
             "amount": amount,
             "from": self.address,
             "slippage": slippage,
@@ -33,7 +33,7 @@ class Inch(Account):
 
         if INCH_CONTRACT["use_ref"]:
             params.update({
-                "referrer": self.w3.to_checksum_address("0x1c7ff320ae4327784b464eed07714581643b36a7"),
+                "referrer": to_checksum_address("0x1c7ff320ae4327784b464eed07714581643b36a7"),
                 "fee": 1
             })
 
@@ -83,7 +83,7 @@ class Inch(Account):
         tx_data = await self.get_tx_data()
         tx_data.update(
             {
-                "to": self.w3.to_checksum_address(transaction_data["tx"]["to"]),
+                "to": to_checksum_address(transaction_data["tx"]["to"]),
                 "data": transaction_data["tx"]["data"],
                 "value": int(transaction_data["tx"]["value"]),
             }
@@ -37,15 +37,18 @@ class L2Telegraph(Account):
 
         l0_fee = await self.get_estimate_fee(L2TELEGRAPH_MESSAGE_CONTRACT, L2TELEGRAPH_MESSAGE_ABI)
 
-        tx_data = await self.get_tx_data(self.w3.to_wei(0.00025, "ether") + l0_fee)
-
         contract = self.get_contract(L2TELEGRAPH_MESSAGE_CONTRACT, L2TELEGRAPH_MESSAGE_ABI)
 
-        transaction = await contract.functions.sendMessage(
-            ' ',
-            175,
-            "0x5f26ea1e4d47071a4d9a2c2611c2ae0665d64b6d0d4a6d5964f3b618d8e46bcfbf2792b0d769fbda"
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "sendMessage",
+            (
+                ' ',
+                175,
+                "0x5f26ea1e4d47071a4d9a2c2611c2ae0665d64b6d0d4a6d5964f3b618d8e46bcfbf2792b0d769fbda"
+            ),
+            self.w3.to_wei(0.00025, "ether") + l0_fee
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -56,11 +59,9 @@ class L2Telegraph(Account):
     async def mint(self):
         logger.info(f"[{self.account_id}][{self.address}] Mint NFT")
 
-        tx_data = await self.get_tx_data(self.w3.to_wei(0.0005, "ether"))
-
         contract = self.get_contract(L2TELEGRAPH_NFT_CONTRACT, L2TELEGRAPH_NFT_ABI)
 
-        transaction = await contract.functions.mint().build_transaction(tx_data)
+        transaction = await self.build_contract_tx(contract, "mint", value=self.w3.to_wei(0.0005, "ether"))
 
         signed_txn = await self.sign(transaction)
 
@@ -80,17 +81,20 @@ class L2Telegraph(Account):
 
         await sleep(sleep_from, sleep_to)
 
-        tx_data = await self.get_tx_data(l0_fee)
-
         logger.info(f"[{self.account_id}][{self.address}] Bridge NFT [{nft_id}]")
 
         contract = self.get_contract(L2TELEGRAPH_NFT_CONTRACT, L2TELEGRAPH_NFT_ABI)
 
-        transaction = await contract.functions.crossChain(
-            175,
-            "0x5b10ae182c297ec76fe6fe0e3da7c4797cede02dd43a183c97db9174962607a8b6552ce320eac5aa",
-            nft_id
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "crossChain",
+            (
+                175,
+                "0x5b10ae182c297ec76fe6fe0e3da7c4797cede02dd43a183c97db9174962607a8b6552ce320eac5aa",
+                nft_id
+            ),
+            l0_fee
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -18,9 +18,7 @@ class MailZero(Account):
     async def mint(self):
         logger.info(f"[{self.account_id}][{self.address}] Mint MailZero NFT")
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await self.contract.functions.mint(196264).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(self.contract, "mint", (196264,))
 
         signed_txn = await self.sign(transaction)
 
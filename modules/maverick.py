@@ -4,7 +4,7 @@ from typing import Union, Dict
 from loguru import logger
 from config import MAVERICK_CONTRACTS, MAVERICK_POSITION_ABI, ZKSYNC_TOKENS, MAVERICK_ROUTER_ABI, ZERO_ADDRESS
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -18,7 +18,7 @@ class Maverick(Account):
         contract = self.get_contract(MAVERICK_CONTRACTS["pool_information"], MAVERICK_POSITION_ABI)
 
         amount = await contract.functions.calculateSwap(
-            self.w3.to_checksum_address(MAVERICK_CONTRACTS["pool"]),
+            to_checksum_address(MAVERICK_CONTRACTS["pool"]),
             amount,
             token_a_in,
             True,
@@ -29,9 +29,9 @@ class Maverick(Account):
 
     def get_path(self, from_token: str, to_token: str):
         path_data = [
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-            self.w3.to_checksum_address(MAVERICK_CONTRACTS["pool"]),
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token]),
+            to_checksum_address(ZKSYNC_TOKENS[from_token]),
+            to_checksum_address(MAVERICK_CONTRACTS["pool"]),
+            to_checksum_address(ZKSYNC_TOKENS[to_token]),
         ]
 
         path = b"".join([bytes.fromhex(address[2:]) for address in path_data])
@@ -39,8 +39,6 @@ class Maverick(Account):
         return path
 
     async def swap_to_token(self, from_token: str, to_token: str, amount: int, slippage: int):
-        tx_data = await self.get_tx_data(amount)
-
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(amount, True, slippage)
@@ -61,17 +59,18 @@ class Maverick(Account):
 
         )
 
-        contract_txn = await self.swap_contract.functions.multicall(
-            [transaction_data, refund_data]
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "multicall",
+            ([transaction_data, refund_data],),
+            amount
+        )
 
         return contract_txn
 
     async def swap_to_eth(self, from_token: str, to_token: str, amount: int, slippage: int):
         await self.approve(amount, ZKSYNC_TOKENS[from_token], MAVERICK_CONTRACTS["router"])
 
-        tx_data = await self.get_tx_data()
-
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(amount, False, slippage)
@@ -96,9 +95,7 @@ class Maverick(Account):
 
         )
 
-        contract_txn = await self.swap_contract.functions.multicall(
-            [transaction_data, unwrap_data]
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(self.swap_contract, "multicall", ([transaction_data, unwrap_data],))
 
         return contract_txn
 
@@ -19,9 +19,7 @@ class Minter(Account):
 
         contract = self.get_contract(random.choice(contracts), MINTER_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.mint(1).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(contract, "mint", (1,))
 
         signed_txn = await self.sign(transaction)
 
@@ -5,7 +5,7 @@ from loguru import logger
 
 from config import MUTE_ROUTER_ABI, MUTE_CONTRACTS, ZKSYNC_TOKENS
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -18,51 +18,56 @@ class Mute(Account):
     async def get_min_amount_out(self, from_token: str, to_token: str, amount: int, slippage: float):
         min_amount_out = await self.swap_contract.functions.getAmountOut(
             amount,
-            self.w3.to_checksum_address(from_token),
-            self.w3.to_checksum_address(to_token)
+            to_checksum_address(from_token),
+            to_checksum_address(to_token)
         ).call()
         return int(min_amount_out[0] - (min_amount_out[0] / 100 * slippage))
 
     async def swap_to_token(self, from_token: str, to_token: str, amount: int, slippage: int):
-        tx_data = await self.get_tx_data(amount)
-
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(ZKSYNC_TOKENS[from_token], ZKSYNC_TOKENS[to_token], amount, slippage)
 
-        contract_txn = await self.swap_contract.functions.swapExactETHForTokensSupportingFeeOnTransferTokens(
-            min_amount_out,
-            [self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-             self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token])],
-            self.address,
-            deadline,
-            [False, False]
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "swapExactETHForTokensSupportingFeeOnTransferTokens",
+            (
+                min_amount_out,
+                [to_checksum_address(ZKSYNC_TOKENS[from_token]),
+                 to_checksum_address(ZKSYNC_TOKENS[to_token])],
+                self.address,
+                deadline,
+                [False, False]
+            ),
+            amount
+        )
 
         return contract_txn
 
     async def swap_to_eth(self, from_token: str, to_token: str, amount: int, slippage: int):
-        token_address = self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token])
+        token_address = to_checksum_address(ZKSYNC_TOKENS[from_token])
 
         from_token_stable = True if from_token == "USDC" else False
 
         await self.approve(amount, token_address, MUTE_CONTRACTS["router"])
 
-        tx_data = await self.get_tx_data()
-        
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(ZKSYNC_TOKENS[from_token], ZKSYNC_TOKENS[to_token], amount, slippage)
 
-        contract_txn = await self.swap_contract.functions.swapExactTokensForETHSupportingFeeOnTransferTokens(
-            amount,
-            min_amount_out,
-            [self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-             self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token])],
-            self.address,
-            deadline,
-            [from_token_stable, False]
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "swapExactTokensForETHSupportingFeeOnTransferTokens",
+            (
+                amount,
+                min_amount_out,
+                [to_checksum_address(ZKSYNC_TOKENS[from_token]),
+                 to_checksum_address(ZKSYNC_TOKENS[to_token])],
+                self.address,
+                deadline,
+                [from_token_stable, False]
+            )
+        )
 
         return contract_txn
 
@@ -5,7 +5,7 @@ from loguru import logger
 
 from config import ZERO_ADDRESS, ZKSYNC_TOKENS, ODOS_CONTRACT
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -22,16 +22,16 @@ class Odos(Account):
         url = "https://api.odos.xyz/sor/quote/v2"
 
         data = {
-            "chainId": await self.w3.eth.chain_id,
+            "chainId": await self.get_chain_id(),
             "inputTokens": [
                 {
-                    "tokenAddress": self.w3.to_checksum_address(from_token),
+                    "tokenAddress": to_checksum_address(from_token),
                     "amount": f"{amount}"
                 }
             ],
             "outputTokens": [
                 {
-                    "tokenAddress": self.w3.to_checksum_address(to_token),
+                    "tokenAddress": to_checksum_address(to_token),
                     "proportion": 1
                 }
             ],
@@ -112,7 +112,7 @@ class Odos(Account):
         to_token = ZERO_ADDRESS if to_token == "ETH" else ZKSYNC_TOKENS[to_token]
 
         if from_token != ZERO_ADDRESS:
-            await self.approve(amount_wei, from_token, self.w3.to_checksum_address(ODOS_CONTRACT["router"]))
+            await self.approve(amount_wei, from_token, to_checksum_address(ODOS_CONTRACT["router"]))
 
         quote_data = await self.quote(from_token, to_token, amount_wei, slippage)
 
@@ -123,7 +123,7 @@ class Odos(Account):
         tx_data = await self.get_tx_data()
         tx_data.update(
             {
-                "to": self.w3.to_checksum_address(transaction["to"]),
+                "to": to_checksum_address(transaction["to"]),
                 "data": transaction["data"],
                 "value": int(transaction["value"]),
             }
@@ -28,18 +28,20 @@ class Omnisea(Account):
 
         title, symbol = self.generate_collection_data()
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await self.contract.functions.create([
-            title,
-            symbol,
-            "",
-            "",
-            0,
-            True,
-            0,
-            int(time.time()) + 1000000]
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            self.contract,
+            "create",
+            ([
+                title,
+                symbol,
+                "",
+                "",
+                0,
+                True,
+                0,
+                int(time.time()) + 1000000
+            ],)
+        )
 
         signed_txn = await self.sign(transaction)
 
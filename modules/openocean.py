@@ -4,7 +4,7 @@ import aiohttp
 from loguru import logger
 from config import OPENOCEAN_CONTRACT, ZKSYNC_TOKENS
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -21,17 +21,17 @@ class OpenOcean(Account):
         url = "https://open-api.openocean.finance/v3/324/swap_quote"
 
         params = {
-            "inTokenAddress": self.w3.to_checksum_address(from_token),
-            "outTokenAddress": self.w3.to_checksum_address(to_token),
+            "inTokenAddress": to_checksum_address(from_token),
+            "outTokenAddress": to_checksum_address(to_token),
             "amount": float(amount),
-            "gasPrice": float(self.w3.from_wei(await self.w3.eth.gas_price, "gwei")),
+            "gasPrice": float(self.w3.from_wei(await self.get_gas_price(), "gwei")),
             "slippage": slippage,
             "account": self.address,
         }
 
         if OPENOCEAN_CONTRACT["use_ref"]:
             params.update({
-                "referrer": self.w3.to_checksum_address("0x1c7ff320ae4327784b464eed07714581643b36a7"),
+                "referrer": to_checksum_address("0x1c7ff320ae4327784b464eed07714581643b36a7"),
                 "referrerFee": 1
             })
 
@@ -86,7 +86,7 @@ class OpenOcean(Account):
         tx_data = await self.get_tx_data()
         tx_data.update(
             {
-                "to": self.w3.to_checksum_address(transaction_data["data"]["to"]),
+                "to": to_checksum_address(transaction_data["data"]["to"]),
                 "data": transaction_data["data"]["data"],
                 "value": int(transaction_data["data"]["value"]),
             }
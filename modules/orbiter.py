@@ -4,7 +4,7 @@ import aiohttp
 from loguru import logger
 
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 from config import ORBITER_CONTRACT
 
@@ -97,7 +97,7 @@ class Orbiter(Account):
             logger.error(f"[{self.account_id}][{self.address}] Insufficient funds!")
         else:
             tx_data = await self.get_tx_data(bridge_amount)
-            tx_data.update({"to": self.w3.to_checksum_address(ORBITER_CONTRACT)})
+            tx_data.update({"to": to_checksum_address(ORBITER_CONTRACT)})
 
             signed_txn = await self.sign(tx_data)
 
@@ -4,7 +4,7 @@ from typing import Union, Dict
 from loguru import logger
 
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 from config import (
@@ -27,8 +27,8 @@ class Pancake(Account):
         factory = self.get_contract(PANCAKE_CONTRACTS["factory"], PANCAKE_FACTORY_ABI)
 
         pool = await factory.functions.getPool(
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token]),
+            to_checksum_address(ZKSYNC_TOKENS[from_token]),
+            to_checksum_address(ZKSYNC_TOKENS[to_token]),
             500
         ).call()
 
@@ -38,8 +38,8 @@ class Pancake(Account):
         quoter = self.get_contract(PANCAKE_CONTRACTS["quoter"], PANCAKE_QUOTER_ABI)
 
         quoter_data = await quoter.functions.quoteExactInputSingle((
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token]),
+            to_checksum_address(ZKSYNC_TOKENS[from_token]),
+            to_checksum_address(ZKSYNC_TOKENS[to_token]),
             amount,
             500,
             0
@@ -48,8 +48,6 @@ class Pancake(Account):
         return int(quoter_data[0] - (quoter_data[0] / 100 * slippage))
 
     async def swap_to_token(self, from_token: str, to_token: str, amount: int, slippage: int):
-        tx_data = await self.get_tx_data(amount)
-
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(from_token, to_token, amount, slippage)
@@ -57,8 +55,8 @@ class Pancake(Account):
         transaction_data = self.swap_contract.encodeABI(
             fn_name="exactInputSingle",
             args=[(
-                self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-                self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token]),
+                to_checksum_address(ZKSYNC_TOKENS[from_token]),
+                to_checksum_address(ZKSYNC_TOKENS[to_token]),
                 500,
                 self.address,
                 amount,
@@ -67,17 +65,21 @@ class Pancake(Account):
             )]
         )
 
-        contract_txn = await self.swap_contract.functions.multicall(
-            deadline, [transaction_data]
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "multicall",
+            (
+                deadline,
+                [transaction_data]
+            ),
+            amount
+        )
 
         return contract_txn
 
     async def swap_to_eth(self, from_token: str, to_token: str, amount: int, slippage: int):
         await self.approve(amount, ZKSYNC_TOKENS[from_token], PANCAKE_CONTRACTS["router"])
 
-        tx_data = await self.get_tx_data()
-
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(from_token, to_token, amount, slippage)
@@ -85,8 +87,8 @@ class Pancake(Account):
         transaction_data = self.swap_contract.encodeABI(
             fn_name="exactInputSingle",
             args=[(
-                self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-                self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token]),
+                to_checksum_address(ZKSYNC_TOKENS[from_token]),
+                to_checksum_address(ZKSYNC_TOKENS[to_token]),
                 500,
                 "0x0000000000000000000000000000000000000002",
                 amount,
@@ -104,10 +106,14 @@ class Pancake(Account):
 
         )
 
-        contract_txn = await self.swap_contract.functions.multicall(
-            deadline,
-            [transaction_data, unwrap_data]
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "multicall",
+            (
+                deadline,
+                [transaction_data, unwrap_data]
+            )
+        )
 
         return contract_txn
 
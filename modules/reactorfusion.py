@@ -3,7 +3,7 @@ from typing import Union, Dict
 from loguru import logger
 from config import REACTORFUSION_CONTRACTS, REACTORFUSION_ABI
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from utils.sleeping import sleep
 from .account import Account
 
@@ -44,9 +44,7 @@ class ReactorFusion(Account):
 
         logger.info(f"[{self.account_id}][{self.address}] Make deposit on ReactorFusion | {amount} ETH")
 
-        tx_data = await self.get_tx_data(amount_wei)
-
-        transaction = await self.contract.functions.mint().build_transaction(tx_data)
+        transaction = await self.build_contract_tx(self.contract, "mint", value=amount_wei)
 
         signed_txn = await self.sign(transaction)
 
@@ -70,9 +68,7 @@ class ReactorFusion(Account):
                 f"{self.w3.from_wei(amount, 'ether')} ETH"
             )
 
-            tx_data = await self.get_tx_data()
-
-            transaction = await self.contract.functions.redeem(amount).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(self.contract, "redeem", (amount,))
 
             signed_txn = await self.sign(transaction)
 
@@ -89,11 +85,11 @@ class ReactorFusion(Account):
 
         contract = self.get_contract(REACTORFUSION_CONTRACTS["collateral"], REACTORFUSION_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.enterMarkets(
-            [self.w3.to_checksum_address(REACTORFUSION_CONTRACTS["landing"])]
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "enterMarkets",
+            ([to_checksum_address(REACTORFUSION_CONTRACTS["landing"])],)
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -108,11 +104,11 @@ class ReactorFusion(Account):
 
         contract = self.get_contract(REACTORFUSION_CONTRACTS["collateral"], REACTORFUSION_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.exitMarket(
-            self.w3.to_checksum_address(REACTORFUSION_CONTRACTS["landing"])
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "exitMarket",
+            (to_checksum_address(REACTORFUSION_CONTRACTS["landing"]),)
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -4,7 +4,7 @@ from typing import Union
 from loguru import logger
 from config import ROCKETSAM_ABI
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from utils.sleeping import sleep
 from .account import Account
 
@@ -14,7 +14,7 @@ class RocketSam(Account):
         super().__init__(account_id=account_id, private_key=private_key, proxy=proxy, chain="zksync")
 
     async def get_deposit_amount(self, contract: str):
-        contract = self.get_contract(self.w3.to_checksum_address(contract), ROCKETSAM_ABI)
+        contract = self.get_contract(to_checksum_address(contract), ROCKETSAM_ABI)
         amount = await contract.functions.balances(self.address).call()
         return amount
 
@@ -45,16 +45,19 @@ class RocketSam(Account):
 
         logger.info(f"[{self.account_id}][{self.address}] Deposit to RocketSam")
 
-        contract = self.get_contract(self.w3.to_checksum_address(random.choice(contracts)), ROCKETSAM_ABI)
+        contract = self.get_contract(to_checksum_address(random.choice(contracts)), ROCKETSAM_ABI)
 
         fee = await contract.functions.estimateProtocolFee(amount_wei).call()
 
-        tx_data = await self.get_tx_data(amount_wei + fee)
-
-        transaction = await contract.functions.depositWithReferrer(
-            self.w3.to_checksum_address("0x1C7FF320aE4327784B464eeD07714581643B36A7"),
-            amount_wei
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            contract,
+            "depositWithReferrer",
+            (
+                to_checksum_address("0x1C7FF320aE4327784B464eeD07714581643B36A7"),
+                amount_wei
+            ),
+            amount_wei + fee
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -79,11 +82,9 @@ class RocketSam(Account):
                     f"{self.w3.from_wei(amount, 'ether')} ETH"
                 )
 
-                contract = self.get_contract(self.w3.to_checksum_address(contract), ROCKETSAM_ABI)
-
-                tx_data = await self.get_tx_data()
+                contract = self.get_contract(to_checksum_address(contract), ROCKETSAM_ABI)
 
-                transaction = await contract.functions.withdraw().build_transaction(tx_data)
+                transaction = await self.build_contract_tx(contract, "withdraw")
 
                 signed_txn = await self.sign(transaction)
 
@@ -4,7 +4,7 @@ from typing import Union, Dict
 from loguru import logger
 from config import SAFE_ABI, SAFE_CONTRACT, ZERO_ADDRESS
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -26,20 +26,22 @@ class GnosisSafe(Account):
                 1,
                 ZERO_ADDRESS,
                 "0x",
-                self.w3.to_checksum_address("0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"),
+                to_checksum_address("0x2f870a80647BbC554F3a0EBD093f11B4d2a7492A"),
                 ZERO_ADDRESS,
                 0,
                 ZERO_ADDRESS
             ]
         )
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await self.contract.functions.createProxyWithNonce(
-            self.w3.to_checksum_address("0x1727c2c531cf966f902E5927b98490fDFb3b2b70"),
-            setup_data,
-            int(time.time()*1000)
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            self.contract,
+            "createProxyWithNonce",
+            (
+                to_checksum_address("0x1727c2c531cf966f902E5927b98490fDFb3b2b70"),
+                setup_data,
+                int(time.time()*1000)
+            )
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -3,6 +3,7 @@ from typing import Union, Dict
 from loguru import logger
 from config import STARGATE_CONTRACT, STARGATE_ABI, ZKSYNC_TOKENS
 from utils.gas_checker import check_gas
+from utils.helpers import to_checksum_address
 from utils.sleeping import sleep
 from .account import Account
 from .syncswap import SyncSwap
@@ -18,7 +19,7 @@ class Stargate(Account):
 
     async def get_lz_estimate_fee(self, amount: int):
         get_fee = await self.brdige_contract.functions.estimateSendFee(
-            self.w3.to_checksum_address(ZKSYNC_TOKENS["MAV"]),
+            to_checksum_address(ZKSYNC_TOKENS["MAV"]),
             102,
             self.address,
             amount,
@@ -84,23 +85,26 @@ class Stargate(Account):
 
             fee = await self.get_lz_estimate_fee(balance["balance_wei"])
 
-            tx_data = await self.get_tx_data(fee)
-
-            transaction = await self.brdige_contract.functions.sendOFT(
-                self.w3.to_checksum_address(ZKSYNC_TOKENS["MAV"]),
-                102,
-                self.address,
-                balance["balance_wei"],
-                0,
-                self.address,
-                "0x0000000000000000000000000000000000000000",
-                "0x000100000000000000000000000000000000000000000000000000000000000186a0",
-                {
-                    "callerBps": 0,
-                    "caller": "0x0000000000000000000000000000000000000000",
-                    "partnerId": "0x0000",
-                }
-            ).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(
+                self.brdige_contract,
+                "sendOFT",
+                (
+                    to_checksum_address(ZKSYNC_TOKENS["MAV"]),
+                    102,
+                    self.address,
+                    balance["balance_wei"],
+                    0,
+                    self.address,
+                    "0x0000000000000000000000000000000000000000",
+                    "0x000100000000000000000000000000000000000000000000000000000000000186a0",
+                    {
+                        "callerBps": 0,
+                        "caller": "0x0000000000000000000000000000000000000000",
+                        "partnerId": "0x0000",
+                    }
+                ),
+                fee
+            )
 
             signed_txn = await self.sign(transaction)
 
@@ -11,7 +11,7 @@ from config import (
     SYNCSWAP_CLASSIC_POOL_DATA_ABI
 )
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 from eth_abi import abi
 
@@ -26,8 +26,8 @@ class SyncSwap(Account):
         contract = self.get_contract(SYNCSWAP_CONTRACTS["classic_pool"], SYNCSWAP_CLASSIC_POOL_ABI)
 
         pool_address = await contract.functions.getPool(
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-            self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token])
+            to_checksum_address(ZKSYNC_TOKENS[from_token]),
+            to_checksum_address(ZKSYNC_TOKENS[to_token])
         ).call()
 
         return pool_address
@@ -57,7 +57,7 @@ class SyncSwap(Account):
             min_percent: int,
             max_percent: int
     ):
-        token_address = self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token])
+        token_address = to_checksum_address(ZKSYNC_TOKENS[from_token])
 
         amount_wei, amount, balance = await self.get_amount(
             from_token,
@@ -76,12 +76,8 @@ class SyncSwap(Account):
         pool_address = await self.get_pool(from_token, to_token)
 
         if pool_address != ZERO_ADDRESS:
-            tx_data = await self.get_tx_data()
-
-            if from_token == "ETH":
-                tx_data.update({"value": amount_wei})
-            else:
-                await self.approve(amount_wei, token_address, self.w3.to_checksum_address(SYNCSWAP_CONTRACTS["router"]))
+            if from_token != "ETH":
+                await self.approve(amount_wei, token_address, to_checksum_address(SYNCSWAP_CONTRACTS["router"]))
 
             min_amount_out = await self.get_min_amount_out(pool_address, token_address, amount_wei, slippage)
 
@@ -100,11 +96,16 @@ class SyncSwap(Account):
 
             deadline = int(time.time()) + 1000000
 
-            contract_txn = await self.swap_contract.functions.swap(
-                paths,
-                min_amount_out,
-                deadline
-            ).build_transaction(tx_data)
+            contract_txn = await self.build_contract_tx(
+                self.swap_contract,
+                "swap",
+                (
+                    paths,
+                    min_amount_out,
+                    deadline
+                ),
+                amount_wei if from_token == "ETH" else 0
+            )
 
             signed_txn = await self.sign(contract_txn)
 
@@ -132,19 +133,22 @@ class SyncSwap(Account):
 
         pool_address = await self.get_pool("ETH", "USDC")
 
-        tx_data = await self.get_tx_data(amount_wei)
-
-        transaction = await self.swap_contract.functions.addLiquidity2(
-            pool_address,
-            [
-                (self.w3.to_checksum_address(ZERO_ADDRESS), amount_wei),
-                (self.w3.to_checksum_address(ZKSYNC_TOKENS["USDC"]), 0)
-            ],
-            abi.encode(["address"], [self.address]),
-            0,
-            ZERO_ADDRESS,
-            "0x"
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            self.swap_contract,
+            "addLiquidity2",
+            (
+                pool_address,
+                [
+                    (to_checksum_address(ZERO_ADDRESS), amount_wei),
+                    (to_checksum_address(ZKSYNC_TOKENS["USDC"]), 0)
+                ],
+                abi.encode(["address"], [self.address]),
+                0,
+                ZERO_ADDRESS,
+                "0x"
+            ),
+            amount_wei
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -18,9 +18,7 @@ class Tavaera(Account):
 
         contract = self.get_contract(TAVAERA_ID_CONTRACT, TAVAERA_ID_ABI)
         
-        tx_data = await self.get_tx_data(self.w3.to_wei(0.0003, "ether"))
-
-        transaction = await contract.functions.mintCitizenId().build_transaction(tx_data)
+        transaction = await self.build_contract_tx(contract, "mintCitizenId", value=self.w3.to_wei(0.0003, "ether"))
 
         signed_txn = await self.sign(transaction)
 
@@ -33,9 +31,7 @@ class Tavaera(Account):
 
         contract = self.get_contract(TAVAERA_CONTRACT, TAVAERA_ABI)
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await contract.functions.mint().build_transaction(tx_data)
+        transaction = await self.build_contract_tx(contract, "mint")
 
         signed_txn = await self.sign(transaction)
 
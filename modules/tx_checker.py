@@ -3,20 +3,16 @@ import random
 
 from eth_typing import ChecksumAddress
 from loguru import logger
-from web3 import Web3, AsyncHTTPProvider
-from web3.eth import AsyncEth
+from web3 import AsyncWeb3
 from eth_account import Account as EthereumAccount
 from tabulate import tabulate
 
 from config import ACCOUNTS, RPC
+from utils.provider import get_provider
 
 
 async def get_nonce(address: ChecksumAddress):
-    web3 = Web3(
-        AsyncHTTPProvider(random.choice(RPC["zksync"]["rpc"])),
-        modules={"eth": (AsyncEth,)},
-        middlewares=[],
-    )
+    web3 = AsyncWeb3(get_provider(random.choice(RPC["zksync"]["rpc"]), None), middlewares=[])
 
     nonce = await web3.eth.get_transaction_count(address)
 
@@ -3,7 +3,7 @@ from typing import Union, Dict
 from loguru import logger
 from config import WOOFI_CONTRACTS, WOOFI_ROUTER_ABI, ZKSYNC_TOKENS
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -15,8 +15,8 @@ class WooFi(Account):
 
     async def get_min_amount_out(self, from_token: str, to_token: str, amount: int, slippage: float):
         min_amount_out = await self.swap_contract.functions.querySwap(
-            self.w3.to_checksum_address(from_token),
-            self.w3.to_checksum_address(to_token),
+            to_checksum_address(from_token),
+            to_checksum_address(to_token),
             amount
         ).call()
         return int(min_amount_out - (min_amount_out / 100 * slippage))
@@ -49,29 +49,30 @@ class WooFi(Account):
             f"[{self.account_id}][{self.address}] Swap on WooFi – {from_token} -> {to_token} | {amount} {from_token}"
         )
 
-        tx_data = await self.get_tx_data()
-
         if from_token == "ETH":
             from_token_address = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
-            to_token_address = self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token])
-            
-            tx_data.update({"value": amount_wei})
+            to_token_address = to_checksum_address(ZKSYNC_TOKENS[to_token])
         else:
-            from_token_address = self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token])
+            from_token_address = to_checksum_address(ZKSYNC_TOKENS[from_token])
             to_token_address = "0xEeeeeEeeeEeEeeEeEeEeeEEEeeeeEeeeeeeeEEeE"
 
             await self.approve(amount_wei, from_token_address, WOOFI_CONTRACTS["router"])
 
         min_amount_out = await self.get_min_amount_out(from_token_address, to_token_address, amount_wei, slippage)
 
-        contract_txn = await self.swap_contract.functions.swap(
-            from_token_address,
-            to_token_address,
-            amount_wei,
-            min_amount_out,
-            self.address,
-            self.address
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "swap",
+            (
+                from_token_address,
+                to_token_address,
+                amount_wei,
+                min_amount_out,
+                self.address,
+                self.address
+            ),
+            amount_wei if from_token == "ETH" else 0
+        )
 
         signed_txn = await self.sign(contract_txn)
 
@@ -4,7 +4,7 @@ import aiohttp
 from loguru import logger
 from config import XYSWAP_CONTRACT, ZKSYNC_TOKENS
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -21,11 +21,11 @@ class XYSwap(Account):
         url = "https://aggregator-api.xy.finance/v1/quote"
 
         params = {
-            "srcChainId": await self.w3.eth.chain_id,
-            "srcQuoteTokenAddress": self.w3.to_checksum_address(from_token),
+            "srcChainId": await self.get_chain_id(),
+            "srcQuoteTokenAddress": to_checksum_address(from_token),
             "srcQuoteTokenAmount": amount,
-            "dstChainId": await self.w3.eth.chain_id,
-            "dstQuoteTokenAddress": self.w3.to_checksum_address(to_token),
+            "dstChainId": await self.get_chain_id(),
+            "dstQuoteTokenAddress": to_checksum_address(to_token),
             "slippage": slippage
         }
 
@@ -40,11 +40,11 @@ class XYSwap(Account):
         url = "https://aggregator-api.xy.finance/v1/buildTx"
 
         params = {
-            "srcChainId": await self.w3.eth.chain_id,
-            "srcQuoteTokenAddress": self.w3.to_checksum_address(from_token),
+            "srcChainId": await self.get_chain_id(),
+            "srcQuoteTokenAddress": to_checksum_address(from_token),
             "srcQuoteTokenAmount": amount,
-            "dstChainId": await self.w3.eth.chain_id,
-            "dstQuoteTokenAddress": self.w3.to_checksum_address(to_token),
+            "dstChainId": await self.get_chain_id(),
+            "dstQuoteTokenAddress": to_checksum_address(to_token),
             "slippage": slippage,
             "receiver": self.address,
             "srcSwapProvider": swap_provider,
@@ -52,7 +52,7 @@ class XYSwap(Account):
 
         if XYSWAP_CONTRACT["use_ref"]:
             params.update({
-                "affiliate": self.w3.to_checksum_address("0x1c7ff320ae4327784b464eed07714581643b36a7"),
+                "affiliate": to_checksum_address("0x1c7ff320ae4327784b464eed07714581643b36a7"),
                 "commissionRate": 10000
             })
 
@@ -112,7 +112,7 @@ class XYSwap(Account):
         tx_data = await self.get_tx_data()
         tx_data.update(
             {
-                "to": self.w3.to_checksum_address(transaction_data["tx"]["to"]),
+                "to": to_checksum_address(transaction_data["tx"]["to"]),
                 "data": transaction_data["tx"]["data"],
                 "value": transaction_data["tx"]["value"],
             }
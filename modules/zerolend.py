@@ -3,7 +3,7 @@ from typing import Union, Dict
 from loguru import logger
 from config import ZEROLEND_CONTRACT, ZEROLEND_WETH_CONTRACT, ZEROLEND_ABI
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from utils.sleeping import sleep
 from .account import Account
 
@@ -47,13 +47,16 @@ class ZeroLend(Account):
 
         logger.info(f"[{self.account_id}][{self.address}] Make deposit on ZeroLend | {amount} ETH")
 
-        tx_data = await self.get_tx_data(amount_wei)
-
-        transaction = await self.contract.functions.depositETH(
-            self.w3.to_checksum_address("0x4d9429246EA989C9CeE203B43F6d1C7D83e3B8F8"),
-            self.address,
-            0
-        ).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(
+            self.contract,
+            "depositETH",
+            (
+                to_checksum_address("0x4d9429246EA989C9CeE203B43F6d1C7D83e3B8F8"),
+                self.address,
+                0
+            ),
+            amount_wei
+        )
 
         signed_txn = await self.sign(transaction)
 
@@ -79,13 +82,15 @@ class ZeroLend(Account):
 
             await self.approve(amount, ZEROLEND_WETH_CONTRACT, ZEROLEND_CONTRACT)
 
-            tx_data = await self.get_tx_data()
-
-            transaction = await self.contract.functions.withdrawETH(
-                self.w3.to_checksum_address("0x4d9429246EA989C9CeE203B43F6d1C7D83e3B8F8"),
-                amount,
-                self.address
-            ).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(
+                self.contract,
+                "withdrawETH",
+                (
+                    to_checksum_address("0x4d9429246EA989C9CeE203B43F6d1C7D83e3B8F8"),
+                    amount,
+                    self.address
+                )
+            )
 
             signed_txn = await self.sign(transaction)
 
@@ -35,9 +35,7 @@ class ZKSDomain(Account):
 
         domain_name = await self.get_random_name()
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await self.contract.functions.register(domain_name, self.address, 1).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(self.contract, "register", (domain_name, self.address, 1))
 
         signed_txn = await self.sign(transaction)
 
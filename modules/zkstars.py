@@ -4,7 +4,7 @@ from typing import Union
 from loguru import logger
 from config import ZKSTARS_ABI
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from utils.sleeping import sleep
 from .account import Account
 
@@ -23,19 +23,19 @@ class ZkStars(Account):
         logger.info(f"[{self.account_id}][{self.address}] Mint {quantity_mint} StarkStars NFT")
 
         for _, contract in enumerate(contracts, start=1):
-            mint_contract = self.get_contract(self.w3.to_checksum_address(contract), ZKSTARS_ABI)
+            mint_contract = self.get_contract(to_checksum_address(contract), ZKSTARS_ABI)
 
             mint_price = await mint_contract.functions.getPrice().call()
             nft_id = await mint_contract.functions.name().call()
 
             logger.info(f"[{self.account_id}][{self.address}] Mint #{nft_id} NFT")
 
-            tx_data = await self.get_tx_data()
-            tx_data.update({"value": mint_price})
-
-            transaction = await mint_contract.functions.safeMint(
-                self.w3.to_checksum_address("0x1C7FF320aE4327784B464eeD07714581643B36A7")
-            ).build_transaction(tx_data)
+            transaction = await self.build_contract_tx(
+                mint_contract,
+                "safeMint",
+                (to_checksum_address("0x1C7FF320aE4327784B464eeD07714581643B36A7"),),
+                mint_price
+            )
 
             signed_txn = await self.sign(transaction)
 
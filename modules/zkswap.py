@@ -4,7 +4,7 @@ from typing import Union
 from loguru import logger
 from config import ZKSWAP_ROUTER_ABI, ZKSWAP_CONTRACTS, ZKSYNC_TOKENS
 from utils.gas_checker import check_gas
-from utils.helpers import retry
+from utils.helpers import retry, to_checksum_address
 from .account import Account
 
 
@@ -18,15 +18,13 @@ class ZKSwap(Account):
         min_amount_out = await self.swap_contract.functions.getAmountsOut(
             amount,
             [
-                self.w3.to_checksum_address(from_token),
-                self.w3.to_checksum_address(to_token)
+                to_checksum_address(from_token),
+                to_checksum_address(to_token)
             ]
         ).call()
         return int(min_amount_out[1] - (min_amount_out[1] / 100 * slippage))
 
     async def swap_to_token(self, from_token: str, to_token: str, amount: int, slippage: int):
-        tx_data = await self.get_tx_data(amount)
-
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(
@@ -36,35 +34,42 @@ class ZKSwap(Account):
             slippage
         )
 
-        contract_txn = await self.swap_contract.functions.swapExactETHForTokens(
-            min_amount_out,
-            [self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-             self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token])],
-            self.address,
-            deadline
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "swapExactETHForTokens",
+            (
+                min_amount_out,
+                [to_checksum_address(ZKSYNC_TOKENS[from_token]),
+                 to_checksum_address(ZKSYNC_TOKENS[to_token])],
+                self.address,
+                deadline
+            ),
+            amount
+        )
 
         return contract_txn
 
     async def swap_to_eth(self, from_token: str, to_token: str, amount: int, slippage: int):
-        token_address = self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token])
+        token_address = to_checksum_address(ZKSYNC_TOKENS[from_token])
 
         await self.approve(amount, token_address, ZKSWAP_CONTRACTS["router"])
 
-        tx_data = await self.get_tx_data()
-
         deadline = int(time.time()) + 1000000
 
         min_amount_out = await self.get_min_amount_out(ZKSYNC_TOKENS[from_token], ZKSYNC_TOKENS[to_token], amount, slippage)
 
-        contract_txn = await self.swap_contract.functions.swapExactTokensForETH(
-            amount,
-            min_amount_out,
-            [self.w3.to_checksum_address(ZKSYNC_TOKENS[from_token]),
-             self.w3.to_checksum_address(ZKSYNC_TOKENS[to_token])],
-            self.address,
-            deadline
-        ).build_transaction(tx_data)
+        contract_txn = await self.build_contract_tx(
+            self.swap_contract,
+            "swapExactTokensForETH",
+            (
+                amount,
+                min_amount_out,
+                [to_checksum_address(ZKSYNC_TOKENS[from_token]),
+                 to_checksum_address(ZKSYNC_TOKENS[to_token])],
+                self.address,
+                deadline
+            )
+        )
 
         return contract_txn
 
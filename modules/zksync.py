@@ -1,18 +1,54 @@
+import asyncio
 import random
-from typing import Union
+import time
+from typing import Union, Dict, Tuple
 
 from loguru import logger
+from web3.types import RPCEndpoint
 
-from config import ZKSYNC_DEPOSIT_ABI, ZKSYNC_WITHDRAW_ABI, ZKSYNC_BRIDGE_CONTRACT, ZKSYNC_TOKENS, WETH_ABI
+from config import RPC, ZKSYNC_DEPOSIT_ABI, ZKSYNC_WITHDRAW_ABI, ZKSYNC_BRIDGE_CONTRACT, ZKSYNC_TOKENS, WETH_ABI
 from utils.gas_checker import check_gas
 from utils.helpers import retry
+from utils.provider import get_provider
 from .account import Account
 
 
 class ZkSync(Account):
+    _L2_GAS_LIMIT_CACHE: Dict[Tuple[str, str], Tuple[float, int]] = {}
+
     def __init__(self, account_id: int, private_key: str, proxy: Union[None, str], chain: str) -> None:
         super().__init__(account_id=account_id, private_key=private_key, proxy=proxy, chain=chain)
 
+        self.proxy = proxy
+
+    async def get_deposit_l2_gas_limit(self, amount_wei: int) -> int:
+        key = (self.chain, self.address)
+        cached = self._L2_GAS_LIMIT_CACHE.get(key)
+
+        if cached is not None and time.monotonic() - cached[0] < 60:
+            return cached[1]
+
+        provider = get_provider(random.choice(RPC["zksync"]["rpc"]), self.proxy)
+
+        response = await provider.make_request(
+            RPCEndpoint("zks_estimateGasL1ToL2"),
+            [{
+                "from": self.address,
+                "to": self.address,
+                "data": "0x",
+                "value": hex(amount_wei),
+                "eip712Meta": {"gasPerPubdata": hex(800)},
+            }]
+        )
+
+        if "error" in response:
+            raise ValueError(response["error"])
+
+        gas_limit = int(response["result"], 16) * 12 // 10
+        self._L2_GAS_LIMIT_CACHE[key] = (time.monotonic(), gas_limit)
+
+        return gas_limit
+
     @retry
     @check_gas
     async def deposit(
@@ -36,23 +72,28 @@ class ZkSync(Account):
 
         logger.info(f"[{self.account_id}][{self.address}] Bridge to ZkSync | {amount} ETH")
 
-        gas_limit = random.randint(700000, 1000000)
-
         contract = self.get_contract(ZKSYNC_BRIDGE_CONTRACT, ZKSYNC_DEPOSIT_ABI)
-        base_cost = await contract.functions.l2TransactionBaseCost(await self.w3.eth.gas_price, gas_limit, 800).call()
-
-        tx_data = await self.get_tx_data(amount_wei + base_cost)
-
-        transaction = await contract.functions.requestL2Transaction(
-            self.address,
-            self.w3.to_wei(amount, "ether"),
-            "0x",
-            gas_limit,
-            800,
-            [],
-            self.address
-        ).build_transaction(
-            tx_data
+
+        gas_limit, gas_price = await asyncio.gather(
+            self.get_deposit_l2_gas_limit(amount_wei),
+            self.get_gas_price()
+        )
+
+        base_cost = await contract.functions.l2TransactionBaseCost(gas_price, gas_limit, 800).call()
+
+        transaction = await self.build_contract_tx(
+            contract,
+            "requestL2Transaction",
+            (
+                self.address,
+                self.w3.to_wei(amount, "ether"),
+                "0x",
+                gas_limit,
+                800,
+                [],
+                self.address
+            ),
+            amount_wei + base_cost
         )
 
         signed_txn = await self.sign(transaction)
@@ -87,11 +128,7 @@ class ZkSync(Account):
         if amount_wei < balance:
             contract = self.get_contract("0x000000000000000000000000000000000000800A", ZKSYNC_WITHDRAW_ABI)
 
-            tx_data = await self.get_tx_data(amount_wei)
-
-            contract_txn = await contract.functions.withdraw(
-                self.address,
-            ).build_transaction(tx_data)
+            contract_txn = await self.build_contract_tx(contract, "withdraw", (self.address,), amount_wei)
 
             signed_txn = await self.sign(contract_txn)
 
@@ -126,9 +163,7 @@ class ZkSync(Account):
 
         logger.info(f"[{self.account_id}][{self.address}] Wrap {amount} ETH")
 
-        tx_data = await self.get_tx_data(amount_wei)
-
-        transaction = await weth_contract.functions.deposit().build_transaction(tx_data)
+        transaction = await self.build_contract_tx(weth_contract, "deposit", value=amount_wei)
 
         signed_txn = await self.sign(transaction)
 
@@ -161,9 +196,7 @@ class ZkSync(Account):
 
         logger.info(f"[{self.account_id}][{self.address}] Unwrap {amount} ETH")
 
-        tx_data = await self.get_tx_data()
-
-        transaction = await weth_contract.functions.withdraw(amount_wei).build_transaction(tx_data)
+        transaction = await self.build_contract_tx(weth_contract, "withdraw", (amount_wei,))
 
         signed_txn = await self.sign(transaction)
 
@@ -2,22 +2,19 @@ import asyncio
 import time
 import random
 
-from web3 import Web3
-from web3.eth import AsyncEth
+from web3 import AsyncWeb3
 
 from config import RPC
 from settings import CHECK_GWEI, MAX_GWEI
 from loguru import logger
 
+from utils.provider import get_provider
 from utils.sleeping import sleep
 
 
 async def get_gas():
     try:
-        w3 = Web3(
-            Web3.AsyncHTTPProvider(random.choice(RPC["ethereum"]["rpc"])),
-            modules={"eth": (AsyncEth,)},
-        )
+        w3 = AsyncWeb3(get_provider(random.choice(RPC["ethereum"]["rpc"]), None))
         gas_price = await w3.eth.gas_price
         gwei = w3.from_wei(gas_price, 'gwei')
         return gwei
@@ -1,4 +1,9 @@
+from functools import lru_cache
+
+from eth_typing import ChecksumAddress
 from loguru import logger
+from web3 import Web3
+
 from settings import RETRY_COUNT
 from utils.sleeping import sleep
 
@@ -26,3 +31,8 @@ def remove_wallet(private_key: str):
         for line in lines:
             if private_key not in line:
                 file.write(line)
+
+
+@lru_cache(maxsize=None)
+def to_checksum_address(address: str) -> ChecksumAddress:
+    return Web3.to_checksum_address(address)
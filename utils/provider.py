@@ -0,0 +1,47 @@
+import re
+from typing import Any, Dict, Tuple, Union
+
+import orjson
+from eth_utils import to_bytes
+from web3 import AsyncHTTPProvider
+from web3._utils.encoding import FriendlyJsonSerde, Web3JsonEncoder
+from web3.types import RPCEndpoint, RPCResponse
+
+# orjson silently turns integers outside the 64-bit range into floats
+_WIDE_INT = re.compile(rb"[:\[,]\s*-?\d{19,}")
+
+
+class FastHTTPProvider(AsyncHTTPProvider):
+    def encode_rpc_request(self, method: RPCEndpoint, params: Any) -> bytes:
+        rpc_dict = {
+            "jsonrpc": "2.0",
+            "method": method,
+            "params": params or [],
+            "id": next(self.request_counter),
+        }
+
+        try:
+            return orjson.dumps(rpc_dict)
+        except TypeError:
+            # HexBytes, AttributeDict and ints wider than 64 bits
+            return to_bytes(text=FriendlyJsonSerde().json_encode(rpc_dict, Web3JsonEncoder))
+
+    def decode_rpc_response(self, raw_response: bytes) -> RPCResponse:
+        if _WIDE_INT.search(raw_response):
+            return super().decode_rpc_response(raw_response)
+
+        return orjson.loads(raw_response)
+
+
+_PROVIDER_CACHE: Dict[Tuple[str, Union[None, str]], FastHTTPProvider] = {}
+
+
+def get_provider(rpc: str, proxy: Union[None, str]) -> FastHTTPProvider:
+    key = (rpc, proxy)
+
+    if key not in _PROVIDER_CACHE:
+        request_kwargs = {"proxy": f"http://{proxy}"} if proxy else {}
+
+        _PROVIDER_CACHE.setdefault(key, FastHTTPProvider(rpc, request_kwargs=request_kwargs))
+
+    return _PROVIDER_CACHE[key]